@@ -250,7 +250,7 @@ cdef class Hashtable:
     cpdef bytes sanitize_kmer(self, object kmer)
     cpdef bytes sanitize_seq_kmer(self, object kmer)
     cdef HashIntoType sanitize_hash_kmer(self, object kmer) except -1
-    cdef bytes _valid_sequence(self, str sequence)
+    cdef bytes _valid_sequence(self, object sequence)
     cdef CpKmer _build_kmer(self, object kmer) except *
     cdef FastxParserPtr _get_parser(self, object parser_or_filename) except *
     cdef list _get_raw_tables(self, uint8_t **, vector[uint64_t])
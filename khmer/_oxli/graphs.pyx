@@ -62,7 +62,7 @@ cdef class Hashtable:
             handled = self.hash(kmer)
         return handled
 
-    cdef bytes _valid_sequence(self, str sequence):
+    cdef bytes _valid_sequence(self, object sequence):
         """Validate sequence argument and convert it to bytes"""
         if len(sequence) < self.ksize():
             raise ValueError("sequence length ({}) must >= the hashtable "
@@ -147,11 +147,28 @@ cdef class Hashtable:
         deref(self._ht_this).get_kmers(data, kmers)
         return kmers
 
-    def consume(self, str sequence):
-        """Increment the counts of all of the k-mers in the sequence."""
+    def consume(self, object sequence):
+        """Increment the counts of all of the k-mers in the sequence.
+
+        `sequence` may be str or ASCII bytes; passing bytes skips the
+        per-call UTF-8 encode.
+        """
         cdef bytes data = self._valid_sequence(sequence)
         return deref(self._ht_this).consume_string(data)
 
+    def consume_many(self, sequences):
+        """Increment the counts of all of the k-mers in each sequence.
+
+        The iteration happens at the Cython level, avoiding one Python
+        call per sequence. Returns the total number of k-mers consumed.
+        """
+        cdef bytes data
+        cdef uint64_t n_consumed = 0
+        for sequence in sequences:
+            data = self._valid_sequence(sequence)
+            n_consumed += deref(self._ht_this).consume_string(data)
+        return n_consumed
+
     def get_kmer_counts(self, str sequence):
         """Retrieve an ordered list of the counts of all k-mers in sequence."""
         cdef bytes data = self._valid_sequence(sequence)
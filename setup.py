@@ -294,7 +294,7 @@ SETUP_METADATA = \
                            "Cython>=0.25.2"],
         "extras_require": {':python_version=="2.6"': ['argparse>=1.2.1'],
                            'docs': ['sphinx', 'sphinxcontrib-autoprogram'],
-                           'tests': ['pytest>=2.9'],
+                           'tests': ['pytest>=2.9', 'pytest-xdist'],
                            'read_aligner_training': ['simplesam']},
         "scripts": SCRIPTS,
         # "entry_points": { # Not ready for distribution yet.
@@ -84,8 +84,10 @@ const
     std::cout << "Right: " << right_contig << std::endl;
 #endif
 
-    right_contig = right_contig.substr(_ksize);
-    return left_contig + right_contig;
+    // append right of the shared seed k-mer in place rather than
+    // building substr and concatenation temporaries
+    left_contig.append(right_contig, _ksize, std::string::npos);
+    return left_contig;
 }
 
 
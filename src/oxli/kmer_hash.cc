@@ -134,6 +134,7 @@ HashIntoType _hash(const std::string kmer, const WordLength k,
 std::string _revhash(HashIntoType hash, WordLength k)
 {
     std::string s = "";
+    s.reserve(k);
 
     unsigned int val = hash & 3;
     s += revtwobit_repr(val);
@@ -38,6 +38,7 @@
 import tempfile
 import os
 import shutil
+from functools import lru_cache
 import pkg_resources
 from pkg_resources import Requirement, resource_filename, ResolutionError
 import sys
@@ -56,11 +57,25 @@ except ImportError:
     from io import StringIO
 
 
-def _equals_rc(query, match):
-    return (query == match) or (revcomp(query) == match)
+def _equals_rc(query, match, match_rc=None):
+    # since revcomp is an involution, comparing query against
+    # revcomp(match) is equivalent to comparing revcomp(query) against
+    # match -- and lets callers pass a precomputed reverse complement
+    if len(query) != len(match):
+        # can't possibly match; skip the revcomp allocation, which
+        # matters when sweeping many candidate paths with any(...)
+        return False
+    if query == match:
+        return True
+    if match_rc is None:
+        match_rc = revcomp(match)
+    return query == match_rc
 
 
 def _contains_rc(match, query):
+    if len(query) > len(match):
+        # too long to be contained; skip the scans and the revcomp
+        return False
     return (query in match) or (revcomp(query) in match)
 
 
@@ -70,7 +85,10 @@ def _calc_md5(fp):
     return m.hexdigest()
 
 
+@lru_cache(maxsize=None)
 def get_test_data(filename):
+    # resolving the path through pkg_resources is surprisingly expensive,
+    # and tests ask for the same files over and over -- so memoize it
     filepath = None
     try:
         filepath = resource_filename(
@@ -37,27 +37,37 @@
 # pylint: disable=missing-docstring,protected-access,no-member,invalid-name
 
 
-import itertools
-import random
+import logging
 
 import khmer
-from khmer.khmer_args import estimate_optimal_with_K_and_f as optimal_fp
-from khmer import ReadParser
-from khmer import reverse_complement as revcomp
 from . import khmer_tst_utils as utils
 from khmer._oxli.assembly import LinearAssembler
 
 import pytest
-import screed
 
-from .graph_features import *
-from .graph_features import K
+# the structure fixtures have to be imported by name for pytest to be
+# able to inject them into the tests here; graph_features.py is not a
+# test_*.py module, so its self-tests are only collected via this import
+from .graph_features import (K, mutate_position, graph, random_sequence,
+                             linear_structure, circular_linear_structure,
+                             right_tip_structure, left_tip_structure,
+                             right_double_fork_structure,
+                             left_double_fork_structure,
+                             right_triple_fork_structure,
+                             snp_bubble_structure, tandem_repeat_structure,
+                             test_mutate_sequence, test_mutate_position,
+                             test_reads)
 
 
 def teardown():
     utils.cleanup()
 
 
+# hot assembly loops log rather than print: %-style deferral means the
+# (large) strings are never formatted unless DEBUG logging is turned on
+logger = logging.getLogger(__name__)
+
+
 @pytest.mark.parametrize("assembler", [LinearAssembler])
 class TestNonBranching:
 
@@ -77,7 +87,7 @@ class TestNonBranching:
 
         for start in range(0, len(contig), 150):
             path = asm.assemble_left(contig[start:start + K])
-            print(path, ', ', contig[:start])
+            logger.debug('start=%d path=%s', start, path)
             assert utils._equals_rc(path, contig[:start + K]), start
 
     def test_all_right_to_end(self, linear_structure, assembler):
@@ -87,7 +97,7 @@ class TestNonBranching:
 
         for start in range(0, len(contig), 150):
             path = asm.assemble_right(contig[start:start + K])
-            print(path, ', ', contig[:start])
+            logger.debug('start=%d path=%s', start, path)
             assert utils._equals_rc(path, contig[start:]), start
 
     def test_circular(self, circular_linear_structure, assembler):
@@ -96,7 +106,7 @@ class TestNonBranching:
         asm = assembler(graph)
 
         path = asm.assemble_right(contig[:K])
-        print(path, ',', contig)
+        logger.debug('path=%s contig=%s', path, contig)
         assert utils._equals_rc(path, contig[:len(path)])
 
     def test_hash_as_seed(self, linear_structure, assembler):
@@ -110,13 +120,15 @@ class TestNonBranching:
 class TestLinearAssembler_RightBranching:
 
     def test_branch_point(self, right_tip_structure):
-        graph, contig, L, HDN, R, tip = right_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            right_tip_structure
 
         assert graph.kmer_degree(HDN) == 3
 
     def test_beginning_to_branch(self, right_tip_structure):
         # assemble from beginning of contig, up until branch point
-        graph, contig, L, HDN, R, tip = right_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            right_tip_structure
         asm = khmer.LinearAssembler(graph)
         path = asm.assemble(contig[0:K])
 
@@ -125,7 +137,8 @@ class TestLinearAssembler_RightBranching:
 
     def test_assemble_takes_hash(self, right_tip_structure):
         # assemble from beginning of contig, up until branch point
-        graph, contig, L, HDN, R, tip = right_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            right_tip_structure
         asm = khmer.LinearAssembler(graph)
         path = asm.assemble(graph.hash(contig[0:K]))
 
@@ -135,16 +148,18 @@ class TestLinearAssembler_RightBranching:
     def test_beginning_to_branch_revcomp(self, right_tip_structure):
         # assemble from beginning of contig, up until branch point
         # starting from rev comp
-        graph, contig, L, HDN, R, tip = right_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            right_tip_structure
         asm = khmer.LinearAssembler(graph)
-        path = asm.assemble(revcomp(contig[0:K]))
+        path = asm.assemble(contig_rc[-K:])
 
         assert len(path) == HDN.pos + K
         assert utils._equals_rc(path, contig[:len(path)])
 
     def test_left_of_branch_to_beginning(self, right_tip_structure):
         # start from HDN (left of branch)
-        graph, contig, L, HDN, R, tip = right_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            right_tip_structure
         asm = khmer.LinearAssembler(graph)
         path = asm.assemble(L)
 
@@ -153,9 +168,10 @@ class TestLinearAssembler_RightBranching:
 
     def test_left_of_branch_to_beginning_revcomp(self, right_tip_structure):
         # start from revcomp of HDN (left of branch)
-        graph, contig, L, HDN, R, tip = right_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            right_tip_structure
         asm = khmer.LinearAssembler(graph)
-        path = asm.assemble(revcomp(L))
+        path = asm.assemble(L_rc)
 
         assert len(path) == HDN.pos + K
         assert utils._equals_rc(path, contig[:len(path)])
@@ -165,34 +181,48 @@ class TestLinearAssembler_RightBranching:
         # Should get the *entire* original contig, as the assembler
         # will move left relative to the branch, and not consider it
         # as a high degree node
-        graph, contig, L, HDN, R, tip = right_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            right_tip_structure
         asm = khmer.LinearAssembler(graph)
         path = asm.assemble(R)
 
         assert len(path) == len(contig)
-        assert utils._equals_rc(path, contig)
+        assert utils._equals_rc(path, contig, contig_rc)
 
     def test_end_to_beginning(self, right_tip_structure):
         # should have exact same behavior as right_of_branch_outwards
-        graph, contig, L, HDN, R, tip = right_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            right_tip_structure
         asm = khmer.LinearAssembler(graph)
         path = asm.assemble(contig[-K:])
 
         assert len(path) == len(contig)
-        assert utils._equals_rc(path, contig)
+        assert utils._equals_rc(path, contig, contig_rc)
+
+
+@pytest.fixture
+def stop_filter_on_tip(left_tip_structure):
+    # a stop_filter blocking the tip of the left_tip_structure; shared
+    # by the stopbf tests so the Nodegraph is only allocated once
+    tip = left_tip_structure[-1]
+    stop_filter = khmer.Nodegraph(K, 1e5, 4)
+    stop_filter.count(tip)
+    return stop_filter
 
 
 class TestLinearAssembler_LeftBranching:
 
     def test_branch_point(self, left_tip_structure):
-        graph, contig, L, HDN, R, tip = left_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            left_tip_structure
 
         assert graph.kmer_degree(HDN) == 3
 
     def test_end_to_branch(self, left_tip_structure):
         # assemble from end until branch point
         # should include HDN
-        graph, contig, L, HDN, R, tip = left_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            left_tip_structure
         asm = khmer.LinearAssembler(graph)
         path = asm.assemble(contig[-K:])
 
@@ -201,46 +231,47 @@ class TestLinearAssembler_LeftBranching:
 
     def test_branch_to_end(self, left_tip_structure):
         # assemble from branch point until end
-        graph, contig, L, HDN, R, tip = left_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            left_tip_structure
         asm = khmer.LinearAssembler(graph)
         path = asm.assemble(HDN)
 
         assert len(path) == len(contig) - HDN.pos
         assert utils._equals_rc(path, contig[HDN.pos:])
 
-    def test_from_branch_to_ends_with_stopbf(self, left_tip_structure):
+    def test_from_branch_to_ends_with_stopbf(self, left_tip_structure,
+                                             stop_filter_on_tip):
         # block the tip with the stop_filter. should return a full length
         # contig.
-        graph, contig, L, HDN, R, tip = left_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            left_tip_structure
 
-        stop_filter = khmer.Nodegraph(K, 1e5, 4)
-        stop_filter.count(tip)
-
-        asm = khmer.LinearAssembler(graph, stop_filter=stop_filter)
+        asm = khmer.LinearAssembler(graph, stop_filter=stop_filter_on_tip)
 
         path = asm.assemble(HDN)
 
         assert len(path) == len(contig)
-        assert utils._equals_rc(path, contig)
+        assert utils._equals_rc(path, contig, contig_rc)
 
-    def test_from_branch_to_ends_with_stopbf_revcomp(self, left_tip_structure):
+    def test_from_branch_to_ends_with_stopbf_revcomp(self, left_tip_structure,
+                                                     stop_filter_on_tip):
         # block the tip with the stop_filter. should return a full length
         # contig.
-        graph, contig, L, HDN, R, tip = left_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            left_tip_structure
 
-        stop_filter = khmer.Nodegraph(K, 1e5, 4)
-        stop_filter.count(tip)
-        asm = khmer.LinearAssembler(graph, stop_filter=stop_filter)
+        asm = khmer.LinearAssembler(graph, stop_filter=stop_filter_on_tip)
 
-        path = asm.assemble(revcomp(HDN))
+        path = asm.assemble(HDN_rc)
 
         assert len(path) == len(contig)
-        assert utils._equals_rc(path, contig)
+        assert utils._equals_rc(path, contig, contig_rc)
 
     def test_end_thru_tip_with_stopbf(self, left_tip_structure):
         # assemble up to branch point, and include introduced branch b/c
         # of stop bf
-        graph, contig, L, HDN, R, tip = left_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            left_tip_structure
 
         stop_filter = khmer.Nodegraph(K, 1e5, 4)
         stop_filter.count(L)          # ...and block original path
@@ -256,7 +287,8 @@ class TestLinearAssembler_LeftBranching:
     def test_single_node_flanked_by_hdns(self, left_tip_structure):
         # assemble single node flanked by high-degree nodes
         # we'll copy the main nodegraph before mutating it
-        graph, contig, L, HDN, R, tip = left_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            left_tip_structure
         asm = khmer.LinearAssembler(graph)
 
         graph.consume(mutate_position(contig, HDN.pos + K))
@@ -279,7 +311,8 @@ class TestLabeledAssembler:
 
     def test_beginning_to_end_across_tip(self, right_tip_structure):
         # assemble entire contig, ignoring branch point b/c of labels
-        graph, contig, L, HDN, R, tip = right_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            right_tip_structure
         lh = khmer.GraphLabels(graph)
         asm = khmer.SimpleLabeledAssembler(lh)
         hdn = graph.find_high_degree_nodes(contig)
@@ -292,7 +325,7 @@ class TestLabeledAssembler:
         path = path[0]  # @CTB
 
         assert len(path) == len(contig)
-        assert utils._equals_rc(path, contig)
+        assert utils._equals_rc(path, contig, contig_rc)
 
     def test_assemble_right_double_fork(self, right_double_fork_structure):
         # assemble two contigs from a double forked structure
@@ -305,7 +338,6 @@ class TestLabeledAssembler:
         print(list(hdn))
         lh.label_across_high_degree_nodes(contig, hdn, 1)
         lh.label_across_high_degree_nodes(branch, hdn, 2)
-        print(lh.get_tag_labels(list(hdn)[0]))
 
         paths = asm.assemble(contig[:K])
         print('Path lengths', [len(x) for x in paths])
@@ -329,7 +361,6 @@ class TestLabeledAssembler:
         lh.label_across_high_degree_nodes(contig, hdn, 1)
         lh.label_across_high_degree_nodes(top_sequence, hdn, 2)
         lh.label_across_high_degree_nodes(bottom_sequence, hdn, 3)
-        print(lh.get_tag_labels(list(hdn)[0]))
 
         paths = asm.assemble(contig[:K])
         print([len(x) for x in paths])
@@ -359,7 +390,6 @@ class TestLabeledAssembler:
         print(list(hdn))
         lh.label_across_high_degree_nodes(contig, hdn, 1)
         lh.label_across_high_degree_nodes(branch, hdn, 2)
-        print(lh.get_tag_labels(list(hdn)[0]))
 
         paths = asm.assemble(contig[-K:])
 
@@ -446,7 +476,8 @@ class TestJunctionCountAssembler:
 
     def test_beginning_to_end_across_tip(self, right_tip_structure):
         # assemble entire contig, ignoring branch point b/c of labels
-        graph, contig, L, HDN, R, tip = right_tip_structure
+        graph, contig, contig_rc, L, L_rc, HDN, HDN_rc, R, tip = \
+            right_tip_structure
         asm = khmer.JunctionCountAssembler(graph)
         asm.consume(contig)
         asm.consume(contig)
@@ -460,4 +491,4 @@ class TestJunctionCountAssembler:
         path = path[0]  # @CTB
 
         assert len(path) == len(contig)
-        assert utils._equals_rc(path, contig)
+        assert utils._equals_rc(path, contig, contig_rc)
@@ -43,6 +43,17 @@ from . import khmer_tst_utils as utils
 
 MAX_COUNT = 255
 
+# decoded 4-mers, cached so each hash bin is only reverse-hashed once
+# across all of the "complete" tests below
+_TETRAMERS = {}
+
+
+def decoded_tetramer(i):
+    kmer = _TETRAMERS.get(i)
+    if kmer is None:
+        kmer = _TETRAMERS[i] = khmer.reverse_hash(i, 4)
+    return kmer
+
 
 @pytest.mark.huge
 def test_toobig():
@@ -83,7 +94,7 @@ def test_complete_no_collision():
     n_entries = kh.hashsizes()[0]
 
     for i in range(0, n_entries):
-        s = khmer.reverse_hash(i, 4)
+        s = decoded_tetramer(i)
         kh.count(s)
 
     n_palindromes = 0
@@ -91,7 +102,7 @@ def test_complete_no_collision():
     n_fwd_filled = 0
 
     for i in range(0, n_entries):
-        s = khmer.reverse_hash(i, 4)
+        s = decoded_tetramer(i)
         if kh.get(s):                   # string hashing is rc aware
             n_rc_filled += 1
         if kh.get(s) == 1:              # palindromes are singular
@@ -110,14 +121,14 @@ def test_complete_2_collision():
 
     n_entries = kh.hashsizes()[0]
     for i in range(0, n_entries):
-        s = khmer.reverse_hash(i, 4)
+        s = decoded_tetramer(i)
         kh.count(s)
 
     n_rc_filled = 0
     #  n_fwd_filled = 0
 
     for i in range(0, 128):
-        s = khmer.reverse_hash(i, 4)
+        s = decoded_tetramer(i)
         if kh.get(s):                   # string hashing is rc aware
             n_rc_filled += 1
     # if kh.get(i):                   # int hashing is not rc aware
@@ -132,14 +143,14 @@ def test_complete_4_collision():
     n_entries = kh.hashsizes()[0]
 
     for i in range(0, n_entries):
-        s = khmer.reverse_hash(i, 4)
+        s = decoded_tetramer(i)
         kh.count(s)
 
     n_rc_filled = 0
     #  n_fwd_filled = 0
 
     for i in range(0, 64):
-        s = khmer.reverse_hash(i, 4)
+        s = decoded_tetramer(i)
         if kh.get(s):                   # string hashing is rc aware
             n_rc_filled += 1
     # if kh.get(i):                   # int hashing is not rc aware
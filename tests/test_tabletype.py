@@ -221,6 +221,29 @@ def test_consume_and_count(AnyTabletype):
         assert tt.get(x[start:start + 6]) == 1
 
 
+def test_consume_bytes(AnyTabletype):
+    # bytes sequences are consumed without a round-trip through unicode
+    tt = AnyTabletype(6)
+
+    x = b"ATGCCGATGCA"
+    num_kmers = tt.consume(x)
+    assert num_kmers == len(x) - tt.ksize() + 1
+
+    assert tt.get("ATGCCG") == 1
+
+
+def test_consume_many_and_count(AnyTabletype):
+    tt = AnyTabletype(6)
+
+    seqs = ["ATGCCGATGCA", "GTCAAATTGTC"]
+    num_kmers = tt.consume_many(seqs)
+    assert num_kmers == sum(len(x) - tt.ksize() + 1 for x in seqs)
+
+    for x in seqs:
+        for start in range(len(x) - 6 + 1):
+            assert tt.get(x[start:start + 6]) == 1
+
+
 def test_consume_and_count_bad_dna(AnyTabletype):
     # while we don't specifically handle bad DNA, we should at least be
     # consistent...